@@ -2,168 +2,361 @@
 Research Manager module for coordinating web research tasks.
 """
 import asyncio
-from typing import Dict, List, Optional
-import json
+import hashlib
+import logging
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, List, Optional
 import ssl
-import google.cloud.aiplatform as aiplatform
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
-from functools import lru_cache
-import sys
-from pathlib import Path
-
-# Add the parent directory to Python path for imports
-sys.path.append(str(Path(__file__).parent.parent))
-
-from config import (
+import os
+import threading
+import diskcache
+import httpx
+import orjson
+
+from ..config import (
     SERPER_API_KEY,
     GEMINI_API_KEY,
+    ERROR_MESSAGES,
     GEMINI_MODEL,
     MAX_SEARCH_RESULTS,
-    REQUEST_TIMEOUT
+    REQUEST_TIMEOUT,
+    SEARCH_APIS,
+    CACHE_ENABLED,
+    CACHE_TTL,
+    CACHE_DIR,
+    MAX_REQUESTS_PER_MINUTE,
+    GEMINI_REQUESTS_PER_MINUTE
 )
 
+from .types import Source
+from ..utils.rate_limiter import RateLimiter
+
+if TYPE_CHECKING:
+    import google.generativeai as genai
+
+logger = logging.getLogger(__name__)
+
+SERPER_ENDPOINT = SEARCH_APIS["serper"]["endpoint"]
+
+# TLS context built once and shared by every client; certificate
+# verification stays on and the CA bundle is only loaded at import
+SSL_CTX = ssl.create_default_context()
+SSL_CTX.set_alpn_protocols(["h2", "http/1.1"])
+
+# Connection pool shared by every request a manager makes
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+# Retry policy for throttled or failing API calls
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF = 0.3
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Pace outbound calls to stay under each provider's quota. Module level so
+# the quota holds across managers and the event loops they run on.
+SEARCH_LIMITER = RateLimiter(MAX_REQUESTS_PER_MINUTE, 60)
+GEMINI_LIMITER = RateLimiter(GEMINI_REQUESTS_PER_MINUTE, 60)
+
+# Disk caches so restarts and other workers reuse results: "search" holds
+# Serper results, "analysis" Gemini analyses keyed by a hash of model + prompt.
+# They are opened on first use, so nothing is created while caching is off.
+_caches: Dict[str, diskcache.Cache] = {}
+_caches_lock = threading.Lock()
+
+def get_cache(name: str) -> diskcache.Cache:
+    """Open the named disk cache under CACHE_DIR, once per process."""
+    with _caches_lock:
+        if name not in _caches:
+            _caches[name] = diskcache.Cache(os.path.join(CACHE_DIR, name), size_limit=2**30)
+        return _caches[name]
+
+# diskcache is blocking SQLite, so coroutines call these via asyncio.to_thread
+def cache_get(name: str, key):
+    return get_cache(name).get(key)
+
+def cache_set(name: str, key, value):
+    get_cache(name).set(key, value, expire=CACHE_TTL)
+
+# Gemini fan-out: sources marshalled into one request, and requests in flight.
+# Up to ~20 sources a single call beats several smaller ones; above that the
+# prompt is split and the batches run in parallel.
+GEMINI_BATCH_SIZE = 20
+GEMINI_CONCURRENCY = 8
+
+_STRING_LIST = {"type": "array", "items": {"type": "string"}}
+
+# Structured-output schema mirroring the report sections
+ANALYSIS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "executive_summary": {
+            "type": "object",
+            "properties": {
+                "overview": {"type": "string"},
+                "highlights": _STRING_LIST,
+                "conclusions": _STRING_LIST
+            },
+            "required": ["overview", "highlights", "conclusions"]
+        },
+        "detailed_findings": {
+            "type": "object",
+            "properties": {
+                "themes": _STRING_LIST,
+                "evidence": _STRING_LIST,
+                "opposing_views": _STRING_LIST,
+                "patterns": _STRING_LIST
+            },
+            "required": ["themes", "evidence", "opposing_views", "patterns"]
+        },
+        "source_analysis": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "url": {"type": "string"},
+                    "reliability_score": {"type": "integer"},
+                    "expertise": {"type": "string"},
+                    "reasoning": {"type": "string"}
+                },
+                "required": ["url", "reliability_score"]
+            }
+        },
+        "context": {
+            "type": "object",
+            "properties": {
+                "historical": {"type": "string"},
+                "current": {"type": "string"},
+                "future": {"type": "string"},
+                "impacts": _STRING_LIST
+            },
+            "required": ["historical", "current", "future", "impacts"]
+        },
+        "recommendations": {
+            "type": "object",
+            "properties": {
+                "actions": _STRING_LIST,
+                "research": _STRING_LIST,
+                "risks": _STRING_LIST,
+                "strategy": _STRING_LIST
+            },
+            "required": ["actions", "research", "risks", "strategy"]
+        }
+    },
+    "required": [
+        "executive_summary",
+        "detailed_findings",
+        "source_analysis",
+        "context",
+        "recommendations"
+    ]
+}
+
 class ResearchManager:
     def __init__(self):
-        # Initialize Gemini client
-        try:
-            import google.generativeai as genai
-            genai.configure(api_key=GEMINI_API_KEY)
-            self.model = genai.GenerativeModel(GEMINI_MODEL)
-        except Exception as e:
-            print(f"Error initializing Gemini: {str(e)}")
-            self.model = None
+        # Gemini client is created on first use, see `model`
+        self._model: Optional["genai.GenerativeModel"] = None
+        self._model_loaded = False
         
         # Initialize search API (will be set based on settings)
         self.search_api = None
 
+        # HTTP client, opened by __aenter__ and reused for every Serper call
+        self.client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def model(self) -> Optional["genai.GenerativeModel"]:
+        """Gemini model, imported and configured on first access."""
+        if not self._model_loaded:
+            self._model_loaded = True
+            try:
+                import google.generativeai as genai
+                genai.configure(api_key=GEMINI_API_KEY)
+                self._model = genai.GenerativeModel(GEMINI_MODEL)
+            except Exception as e:
+                logger.error("Error initializing Gemini: %s", e)
+        return self._model
+
+    async def __aenter__(self):
+        if self.client is None:
+            self.client = httpx.AsyncClient(
+                headers={
+                    "X-API-KEY": SERPER_API_KEY,
+                    "Content-Type": "application/json"
+                },
+                transport=httpx.AsyncHTTPTransport(
+                    verify=SSL_CTX,
+                    http2=True,
+                    limits=HTTP_LIMITS,
+                    retries=RETRY_ATTEMPTS  # connection failures only
+                ),
+                timeout=REQUEST_TIMEOUT
+            )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+
     def conduct_research(self, query: str, settings: Dict) -> Dict:
+        """
+        Synchronous entry point for callers without an event loop (e.g. Streamlit).
+        """
+        async def run():
+            async with self:
+                return await self.conduct_research_async(query, settings)
+
+        return asyncio.run(run())
+
+    async def conduct_research_async(self, query: str, settings: Dict) -> Dict:
         """
         Main research workflow coordinating the entire research process.
         """
         try:
-            print("\n=== Starting Research Process ===")
+            logger.info("Starting research process")
             
-            # 1. Perform web search
-            print("Step 1: Performing web search...")
-            search_results = self._search_web(query, settings)
-            print(f"Found {len(search_results)} search results")
+            # 1. Perform web search, warming up Gemini meanwhile
+            logger.info("Step 1: Performing web search")
+            search_results, gemini_ok = await asyncio.gather(
+                self._search_web(query, settings),
+                asyncio.to_thread(self._prepare_gemini)
+            )
+            logger.info("Found %d search results", len(search_results))
             
             # 2. Extract content from search results
-            print("\nStep 2: Extracting content...")
+            logger.info("Step 2: Extracting content")
             extracted_content = self._extract_content(search_results)
-            print(f"Extracted content from {len(extracted_content)} sources")
+            logger.info("Extracted content from %d sources", len(extracted_content))
             
             # 3. Analyze content
-            print("\nStep 3: Analyzing content...")
-            analyzed_content = self._analyze_content(extracted_content, query)
-            print("Content analysis complete")
+            logger.info("Step 3: Analyzing content")
+            analyzed_content = await self._analyze_content(extracted_content, query, gemini_ok)
             if analyzed_content:
-                print("Analysis result structure:", analyzed_content.keys())
+                logger.debug("Analysis result structure: %s", analyzed_content.keys())
             
             # 4. Generate final report
-            print("\nStep 4: Generating final report...")
+            logger.info("Step 4: Generating final report")
             report = self._generate_report(analyzed_content, query)
-            print("Report generation complete")
             if report:
-                print("Report structure:", report.keys())
+                logger.debug("Report structure: %s", report.keys())
             
             return report
             
-        except Exception as e:
-            print("\n=== Research Error ===")
-            print(f"Error during research: {str(e)}")
-            import traceback
-            print("Traceback:")
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error during research")
             raise
     
-    def _verify_api_connection(self) -> bool:
-        """Verify API connection before making requests."""
-        try:
-            response = self.session.get(
-                "https://google.serper.dev/search",
-                timeout=5,
-                verify=False
-            )
-            return response.status_code == 200
-        except:
-            return False
+    def _prepare_gemini(self) -> bool:
+        """Probe Gemini and, if reachable, load the SDK so analysis starts warm."""
+        from ..utils.api_checker import check_gemini_api
+
+        gemini_ok, _ = check_gemini_api()
+        return gemini_ok and self.model is not None
+
+    async def _post_with_retry(self, url: str, **kwargs) -> httpx.Response:
+        """POST with exponential backoff on throttling and server errors."""
+        for attempt in range(RETRY_ATTEMPTS + 1):
+            async with SEARCH_LIMITER:
+                response = await self.client.post(url, **kwargs)
+            if response.status_code not in RETRY_STATUSES or attempt == RETRY_ATTEMPTS:
+                return response
+            await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+
+    async def _cached_search(self, query: str, time_range: str, num: int = MAX_SEARCH_RESULTS) -> List[Dict]:
+        """Cached Serper search results to reduce API calls."""
+        key = ("serper", query, time_range, num)
+        if CACHE_ENABLED:
+            cached = await asyncio.to_thread(cache_get, "search", key)
+            if cached is not None:
+                return cached
 
-    @lru_cache(maxsize=100)
-    def _cached_search(self, query: str, time_range: str) -> List[Dict]:
-        """Cached search results to reduce API calls."""
         payload = {
             "q": query,
-            "num": MAX_SEARCH_RESULTS
+            "num": num
         }
         
         if time_range != "All time":
             payload["timeRange"] = time_range.lower()
         
-        try:
-            response = self.session.post(
-                "https://google.serper.dev/search",
-                json=payload,
-                timeout=REQUEST_TIMEOUT,
-                verify=False
-            )
-            response.raise_for_status()
-            return response.json().get("organic", [])
-        except Exception as e:
-            print(f"Search error: {str(e)}")
-            return []
+        response = await self._post_with_retry(
+            SERPER_ENDPOINT,
+            content=orjson.dumps(payload),  # Content-Type is set on the client
+            timeout=REQUEST_TIMEOUT
+        )
+        response.raise_for_status()
+        results = orjson.loads(response.content).get("organic", [])
+        if CACHE_ENABLED:
+            await asyncio.to_thread(cache_set, "search", key, results)
+        return results
 
-    def _search_web(self, query: str, settings: Dict) -> List[Dict]:
+    async def _search_web(self, query: str, settings: Dict) -> List[Dict]:
         """Perform web search using selected API."""
-        from utils.search_apis import get_search_api
+        from ..utils.search_apis import get_search_api, HTTP_ERROR_MESSAGES
         
         try:
-            # Initialize search API if needed
-            if not self.search_api or self.search_api.name != settings["search_api"]:
-                self.search_api = get_search_api(settings["search_api"])
-            
-            # Perform search
-            results = self.search_api.search(query, settings)
+            if settings["search_api"] == "serper":
+                # Serper goes through the shared client so connections are reused
+                results = await self._cached_search(
+                    query,
+                    settings.get("time_range", "All time"),
+                    settings.get("max_results", MAX_SEARCH_RESULTS)
+                )
+            else:
+                # Initialize search API if needed
+                if not self.search_api or self.search_api.name != settings["search_api"]:
+                    self.search_api = get_search_api(settings["search_api"])
+                
+                # SDK clients are blocking, keep them off the event loop
+                results = await asyncio.to_thread(self.search_api.search, query, settings)
             
             if not results:
-                print("Warning: No results found")
+                logger.warning("No results found")
                 return []
                 
-            print(f"Found {len(results)} results from {settings['search_api']} API")
+            logger.info("Found %d results from %s API", len(results), settings["search_api"])
             return results
             
+        # Serper errors surface as httpx exceptions; show the same messages
+        # handle_api_errors gives for the other search APIs
+        except httpx.TimeoutException as e:
+            logger.error("Search error: %s", e)
+            raise Exception(ERROR_MESSAGES["network_error"]) from e
+        except httpx.HTTPStatusError as e:
+            logger.error("Search error: %s", e)
+            message = HTTP_ERROR_MESSAGES.get(e.response.status_code)
+            raise Exception(message or f"Search failed: {str(e)}") from e
+        except httpx.HTTPError as e:
+            logger.error("Search error: %s", e)
+            raise Exception(f"Search failed: {str(e)}") from e
         except Exception as e:
-            print(f"Search error: {str(e)}")
+            logger.error("Search error: %s", e)
             raise
 
-    def _extract_content(self, search_results: List[Dict]) -> List[Dict]:
+    def _extract_content(self, search_results: List[Dict]) -> List[Source]:
         """Extract relevant content from search results."""
-        return [{
-            "title": result.get("title", ""),
-            "url": result.get("link", ""),
-            "snippet": result.get("snippet", ""),
-            "position": result.get("position", 0)
-        } for result in search_results]
-
-    def _analyze_content(self, content: List[Dict], original_query: str) -> Dict:
+        return [
+            Source(
+                result.get("title", ""),
+                result.get("link", ""),
+                result.get("snippet", ""),
+                result.get("position", 0)
+            )
+            for result in search_results
+        ]
+
+    async def _analyze_content(self, content: List[Source], original_query: str, gemini_ok: bool) -> Dict:
         """Analyze content using Gemini if available, otherwise provide basic analysis."""
         if not content:
             return self._create_empty_analysis()
 
         # Try to use Gemini for analysis
         try:
-            from utils.api_checker import check_gemini_api
-            gemini_ok, _ = check_gemini_api()
-            
             if gemini_ok and self.model:
-                return self._analyze_with_gemini(content, original_query)
+                return await self._analyze_with_gemini(content, original_query)
             else:
-                print("Gemini API unavailable, using basic analysis")
+                logger.info("Gemini API unavailable, using basic analysis")
                 return self._analyze_basic(content, original_query)
         except Exception as e:
-            print(f"Error during analysis: {str(e)}")
+            logger.warning("Error during analysis, using basic analysis: %s", e)
             return self._analyze_basic(content, original_query)
 
     def _create_empty_analysis(self) -> Dict:
@@ -194,19 +387,23 @@ class ResearchManager:
             }
         }
 
-    def _analyze_basic(self, content: List[Dict], query: str) -> Dict:
+    def _analyze_basic(self, content: List[Source], query: str) -> Dict:
         """Provide basic analysis when Gemini is unavailable."""
         # Create basic summary
         summary = f"Basic analysis of {len(content)} sources about '{query}'"
         
-        # Extract main themes from titles
-        themes = []
-        evidence = []
+        # Extract themes, evidence and source entries in a single pass
+        themes, evidence, sources = [], [], []
         for item in content:
-            if item["title"] and len(themes) < 5:
-                themes.append(item["title"])
-            if item["snippet"]:
-                evidence.append(item["snippet"])
+            if item.title and len(themes) < 5:
+                themes.append(item.title)
+            if item.snippet:
+                evidence.append(item.snippet)
+            sources.append({
+                "url": item.url,
+                "reliability_score": 70,  # Default score
+                "reasoning": "Basic credibility assessment"
+            })
         
         return {
             "executive_summary": {
@@ -222,11 +419,7 @@ class ResearchManager:
                 "evidence": evidence,
                 "opposing_views": []
             },
-            "source_analysis": [{
-                "url": item["url"],
-                "reliability_score": 70,  # Default score
-                "reasoning": "Basic credibility assessment"
-            } for item in content],
+            "source_analysis": sources,
             "context": {
                 "historical": "",
                 "current": "Analysis performed without AI assistance",
@@ -241,191 +434,121 @@ class ResearchManager:
             }
         }
 
-    def _analyze_with_gemini(self, content: List[Dict], original_query: str) -> Dict:
-        """Analyze content using Gemini AI."""
-        content_text = "\n\n".join([
-            f"Title: {item['title']}\nURL: {item['url']}\nContent: {item['snippet']}"
+    async def _analyze_with_gemini(self, content: List[Source], original_query: str) -> Dict:
+        """Analyze content using Gemini AI, one request per batch of sources."""
+        semaphore = asyncio.Semaphore(GEMINI_CONCURRENCY)
+        batches = [
+            content[i:i + GEMINI_BATCH_SIZE]
+            for i in range(0, len(content), GEMINI_BATCH_SIZE)
+        ]
+        responses = await asyncio.gather(
+            *(self._analyze_batch_with_gemini(batch, original_query, semaphore) for batch in batches),
+            return_exceptions=True
+        )
+
+        analyses = [r for r in responses if not isinstance(r, Exception)]
+        if not analyses:
+            raise responses[0]
+        if len(analyses) < len(responses):
+            logger.warning("Analysis error: %d of %d batches failed", len(responses) - len(analyses), len(responses))
+
+        return analyses[0] if len(analyses) == 1 else self._merge_analyses(analyses)
+
+    def _merge_analyses(self, analyses: List[Dict]) -> Dict:
+        """Combine per-batch analyses into a single report structure."""
+        merged = {}
+        text_parts = defaultdict(list)
+        for analysis in analyses:
+            for section, value in analysis.items():
+                if isinstance(value, list):
+                    merged.setdefault(section, []).extend(value)
+                    continue
+
+                target = merged.setdefault(section, {})
+                for key, item in value.items():
+                    if isinstance(item, list):
+                        target.setdefault(key, []).extend(item)
+                    else:
+                        parts = text_parts[section, key]
+                        if item:
+                            parts.append(item)
+
+        # Join text fields once instead of growing them per batch
+        for (section, key), parts in text_parts.items():
+            merged[section][key] = " ".join(parts)
+        return merged
+
+    async def _analyze_batch_with_gemini(self, content: List[Source], original_query: str,
+                                         semaphore: asyncio.Semaphore) -> Dict:
+        """Analyze one batch of sources with a single JSON-mode Gemini request."""
+        content_text = "\n\n".join(
+            f"Title: {item.title}\nURL: {item.url}\nContent: {item.snippet}"
             for item in content
-        ])
+        )
 
-        try:
-            response = self.model.generate_content(
-                f"""Please analyze the provided content and present a comprehensive research report using the following structured format:
+        prompt = f"""Please analyze the provided content and present a comprehensive research report.
 
                 RESEARCH TOPIC: {original_query}
 
                 CONTENT TO ANALYZE:
                 {content_text}
 
-                Please provide your analysis in the following detailed structure:
-
-                1. EXECUTIVE SUMMARY
-                - Overview: Write a comprehensive 2-3 paragraph summary
-                - Key Highlights: List 5-7 most important points
-                - Main Conclusions: 2-3 primary takeaways
-
-                2. DETAILED FINDINGS
-                - Major Themes (3-5):
-                  * Theme description
-                  * Supporting evidence
-                  * Statistical data if available
-                - Opposing Viewpoints:
-                  * Alternative perspectives
-                  * Counter-arguments
-                - Emerging Patterns:
-                  * Trends
-                  * Common elements
-
-                3. SOURCE ANALYSIS
-                For each source:
-                - URL
-                - Credibility Score (0-100)
-                - Expertise Level
-                - Publication Impact
-                - Bias Assessment
-                - Citation Analysis
-
-                4. CONTEXTUAL ANALYSIS
-                - Historical Background:
-                  * Key developments
-                  * Evolution of topic
-                - Current Landscape:
-                  * Present state
-                  * Key stakeholders
-                - Future Implications:
-                  * Predicted trends
-                  * Potential impacts
-
-                5. RECOMMENDATIONS
-                - Actionable Insights (3-5):
-                  * Specific actions
-                  * Implementation steps
-                - Research Gaps:
-                  * Areas needing further study
-                  * Open questions
-                - Risk Assessment:
-                  * Potential challenges
-                  * Mitigation strategies
-                - Strategic Considerations:
-                  * Long-term implications
-                  * Success factors
-
-                Format your response as a clear, professional research report with detailed explanations and evidence-based analysis.
-                Present the information in a structured, easy-to-follow format with clear section headings.
-                """,
-                generation_config={
-                    "temperature": 0.7,
-                    "top_p": 0.8,
-                    "top_k": 40
-                }
-            )
+                Fill in every field of the response schema:
 
-            if not response.text:
-                raise ValueError("Empty response from Gemini")
+                - executive_summary.overview: a comprehensive 2-3 paragraph summary
+                - executive_summary.highlights: the 5-7 most important points
+                - executive_summary.conclusions: 2-3 primary takeaways
+                - detailed_findings.themes: 3-5 major themes
+                - detailed_findings.evidence: supporting evidence and statistical data
+                - detailed_findings.opposing_views: alternative perspectives and counter-arguments
+                - detailed_findings.patterns: emerging trends and common elements
+                - source_analysis: one entry per source with its URL, a credibility score (0-100),
+                  expertise level and a short bias assessment as reasoning
+                - context.historical: key developments and evolution of the topic
+                - context.current: present state and key stakeholders
+                - context.future: predicted trends
+                - context.impacts: potential impacts
+                - recommendations.actions: 3-5 specific actions with implementation steps
+                - recommendations.research: research gaps and open questions
+                - recommendations.risks: potential challenges and mitigation strategies
+                - recommendations.strategy: long-term implications and success factors
 
-            # Parse and structure the response
-            sections = {}
-            current_section = None
-            current_subsection = None
-            buffer = []
+                Base the analysis on the provided content and keep it professional and evidence-based.
+                """
 
-            for line in response.text.split('\n'):
-                line = line.strip()
-                if not line:
-                    continue
+        cache_key = hashlib.sha256(f"{GEMINI_MODEL}\n{prompt}".encode()).hexdigest()
+        if CACHE_ENABLED:
+            cached = await asyncio.to_thread(cache_get, "analysis", cache_key)
+            if cached is not None:
+                return cached
 
-                # Main sections
-                if "1. EXECUTIVE SUMMARY" in line:
-                    current_section = "executive_summary"
-                    sections[current_section] = {"overview": "", "highlights": [], "conclusions": []}
-                elif "2. DETAILED FINDINGS" in line:
-                    current_section = "detailed_findings"
-                    sections[current_section] = {"themes": [], "evidence": [], "opposing_views": [], "patterns": []}
-                elif "3. SOURCE ANALYSIS" in line:
-                    current_section = "source_analysis"
-                    sections[current_section] = []
-                elif "4. CONTEXTUAL ANALYSIS" in line:
-                    current_section = "context"
-                    sections[current_section] = {"historical": "", "current": "", "future": "", "impacts": []}
-                elif "5. RECOMMENDATIONS" in line:
-                    current_section = "recommendations"
-                    sections[current_section] = {"actions": [], "research": [], "risks": [], "strategy": []}
-                
-                # Process content based on section
-                elif current_section == "executive_summary":
-                    if "Overview:" in line:
-                        current_subsection = "overview"
-                    elif "Key Highlights:" in line:
-                        current_subsection = "highlights"
-                    elif "Main Conclusions:" in line:
-                        current_subsection = "conclusions"
-                    elif line.startswith('*') or line.startswith('-'):
-                        if current_subsection in ["highlights", "conclusions"]:
-                            sections[current_section][current_subsection].append(line.strip('*- '))
-                    elif current_subsection == "overview":
-                        sections[current_section]["overview"] += line + " "
-                
-                elif current_section == "detailed_findings":
-                    if "Major Themes" in line:
-                        current_subsection = "themes"
-                    elif "Supporting evidence" in line:
-                        current_subsection = "evidence"
-                    elif "Opposing Viewpoints" in line:
-                        current_subsection = "opposing_views"
-                    elif "Emerging Patterns" in line:
-                        current_subsection = "patterns"
-                    elif line.startswith('*') or line.startswith('-'):
-                        if current_subsection:
-                            sections[current_section][current_subsection].append(line.strip('*- '))
-                
-                elif current_section == "source_analysis":
-                    if line.startswith('URL:'):
-                        if buffer:
-                            sections[current_section].append(dict(buffer))
-                        buffer = []
-                        buffer.append(("url", line.split(':', 1)[1].strip()))
-                    elif line.startswith('Credibility Score:'):
-                        buffer.append(("reliability_score", int(line.split(':', 1)[1].strip().rstrip('%'))))
-                    elif line.startswith('Expertise Level:'):
-                        buffer.append(("expertise", line.split(':', 1)[1].strip()))
-                    elif line.startswith('Bias Assessment:'):
-                        buffer.append(("reasoning", line.split(':', 1)[1].strip()))
-                
-                elif current_section == "context":
-                    if "Historical Background:" in line:
-                        current_subsection = "historical"
-                    elif "Current Landscape:" in line:
-                        current_subsection = "current"
-                    elif "Future Implications:" in line:
-                        current_subsection = "future"
-                    elif line.startswith('*') or line.startswith('-'):
-                        sections[current_section]["impacts"].append(line.strip('*- '))
-                    elif current_subsection:
-                        sections[current_section][current_subsection] += line + " "
-                
-                elif current_section == "recommendations":
-                    if "Actionable Insights" in line:
-                        current_subsection = "actions"
-                    elif "Research Gaps" in line:
-                        current_subsection = "research"
-                    elif "Risk Assessment" in line:
-                        current_subsection = "risks"
-                    elif "Strategic Considerations" in line:
-                        current_subsection = "strategy"
-                    elif line.startswith('*') or line.startswith('-'):
-                        if current_subsection:
-                            sections[current_section][current_subsection].append(line.strip('*- '))
-
-            # Add last source if any
-            if current_section == "source_analysis" and buffer:
-                sections["source_analysis"].append(dict(buffer))
-
-            return sections
+        try:
+            async with semaphore, GEMINI_LIMITER:
+                response = await self.model.generate_content_async(
+                    prompt,
+                    generation_config={
+                        # Cached answers should not depend on sampling luck
+                        "temperature": 0 if CACHE_ENABLED else 0.7,
+                        "top_p": 0.8,
+                        "top_k": 40,
+                        "response_mime_type": "application/json",
+                        "response_schema": ANALYSIS_SCHEMA
+                    }
+                )
+
+            if not response.text:
+                raise ValueError("Empty response from Gemini")
+
+            sections = orjson.loads(response.text)
 
         except Exception as e:
-            print(f"Analysis error: {str(e)}")
+            logger.error("Analysis error: %s", e)
             raise
 
+        if CACHE_ENABLED:
+            await asyncio.to_thread(cache_set, "analysis", cache_key, sections)
+        return sections
+
     def _generate_report(self, analysis: Dict, query: str) -> Dict:
         """Generate final research report with enhanced detail."""
         if not analysis:
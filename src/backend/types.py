@@ -0,0 +1,12 @@
+"""
+Data types shared by the research pipeline stages.
+"""
+from dataclasses import dataclass
+
+@dataclass(frozen=True, slots=True)
+class Source:
+    """A search result normalized across search APIs."""
+    title: str
+    url: str
+    snippet: str
+    position: int
@@ -2,16 +2,57 @@
 Configuration settings for the Web Research Agent.
 """
 import os
+from dataclasses import dataclass
 from decouple import config
 
+# Repository root, so relative paths don't depend on the working directory
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Application settings, loaded once at import."""
+    is_production: bool
+    serper_api_key: str
+    tavily_api_key: str
+    gemini_api_key: str
+    gemini_model: str
+    max_search_results: int
+    default_search_depth: int
+    request_timeout: int
+    cache_enabled: bool
+    cache_ttl: int
+    cache_dir: str
+    max_requests_per_minute: int
+    gemini_requests_per_minute: int
+    log_level: str
+
+# python-decouple checks environment variables first (Heroku config vars),
+# then falls back to .env
+CONFIG = Config(
+    is_production=os.environ.get('DYNO') is not None,  # Check if running on Heroku
+    serper_api_key=config('SERPER_API_KEY', default=''),
+    tavily_api_key=config('TAVILY_API_KEY', default=''),
+    gemini_api_key=config('GEMINI_API_KEY', default=''),
+    gemini_model=config('GEMINI_MODEL', default='gemini-2.0-flash'),
+    max_search_results=config('MAX_SEARCH_RESULTS', default=10, cast=int),
+    default_search_depth=config('DEFAULT_SEARCH_DEPTH', default=3, cast=int),
+    request_timeout=config('REQUEST_TIMEOUT', default=30, cast=int),
+    cache_enabled=config('CACHE_ENABLED', default=True, cast=bool),
+    cache_ttl=config('CACHE_TTL', default=3600, cast=int),  # 1 hour
+    cache_dir=os.path.join(PROJECT_ROOT, config('CACHE_DIR', default='.cache')),
+    max_requests_per_minute=config('MAX_REQUESTS_PER_MINUTE', default=60, cast=int),
+    gemini_requests_per_minute=config('GEMINI_REQUESTS_PER_MINUTE', default=15, cast=int),
+    log_level=config('LOG_LEVEL', default='INFO', cast=str.upper)
+)
+
 # Environment
-IS_PRODUCTION = os.environ.get('DYNO') is not None  # Check if running on Heroku
+IS_PRODUCTION = CONFIG.is_production
 
-# API Keys - try environment variables first (for Heroku), then fallback to .env
-SERPER_API_KEY = os.environ.get('SERPER_API_KEY') or config('SERPER_API_KEY', default='')
-TAVILY_API_KEY = os.environ.get('TAVILY_API_KEY') or config('TAVILY_API_KEY', default='')
-GEMINI_API_KEY = os.environ.get('GEMINI_API_KEY') or config('GEMINI_API_KEY', default='')
-GEMINI_MODEL = os.environ.get('GEMINI_MODEL') or config('GEMINI_MODEL', default='gemini-2.0-flash')
+# API Keys
+SERPER_API_KEY = CONFIG.serper_api_key
+TAVILY_API_KEY = CONFIG.tavily_api_key
+GEMINI_API_KEY = CONFIG.gemini_api_key
+GEMINI_MODEL = CONFIG.gemini_model
 
 # Search API Configuration
 SEARCH_APIS = {
@@ -26,16 +67,21 @@ SEARCH_APIS = {
 }
 
 # Search Settings
-MAX_SEARCH_RESULTS = int(os.environ.get('MAX_SEARCH_RESULTS') or config('MAX_SEARCH_RESULTS', default=10))
-DEFAULT_SEARCH_DEPTH = int(os.environ.get('DEFAULT_SEARCH_DEPTH') or config('DEFAULT_SEARCH_DEPTH', default=3))
-REQUEST_TIMEOUT = int(os.environ.get('REQUEST_TIMEOUT') or config('REQUEST_TIMEOUT', default=30))
+MAX_SEARCH_RESULTS = CONFIG.max_search_results
+DEFAULT_SEARCH_DEPTH = CONFIG.default_search_depth
+REQUEST_TIMEOUT = CONFIG.request_timeout
 
 # Cache Settings
-CACHE_ENABLED = bool(os.environ.get('CACHE_ENABLED') or config('CACHE_ENABLED', default=True, cast=bool))
-CACHE_TTL = int(os.environ.get('CACHE_TTL') or config('CACHE_TTL', default=3600))  # 1 hour
+CACHE_ENABLED = CONFIG.cache_enabled
+CACHE_TTL = CONFIG.cache_ttl
+CACHE_DIR = CONFIG.cache_dir
 
 # Rate Limiting
-MAX_REQUESTS_PER_MINUTE = int(os.environ.get('MAX_REQUESTS_PER_MINUTE') or config('MAX_REQUESTS_PER_MINUTE', default=60))
+MAX_REQUESTS_PER_MINUTE = CONFIG.max_requests_per_minute
+GEMINI_REQUESTS_PER_MINUTE = CONFIG.gemini_requests_per_minute
+
+# Logging
+LOG_LEVEL = CONFIG.log_level
 
 # Error Messages
 ERROR_MESSAGES = {
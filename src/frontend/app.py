@@ -1,39 +1,29 @@
-import json
+import functools
+import logging
+import re
+from collections import deque
+from datetime import datetime
+import orjson
 import streamlit as st
 import pandas as pd
-import sys
-from pathlib import Path
 
-# Add the parent directory to Python path for imports
-sys.path.append(str(Path(__file__).parent.parent))
+from ..backend.research_manager import ResearchManager
+from ..utils.research_report import create_report_from_analysis, display_report
+from ..config import MAX_SEARCH_RESULTS, DEFAULT_SEARCH_DEPTH, LOG_LEVEL
 
-from backend.research_manager import ResearchManager
-from utils.research_report import create_report_from_analysis, display_report
-from config import MAX_SEARCH_RESULTS, DEFAULT_SEARCH_DEPTH
+logging.basicConfig(level=LOG_LEVEL)
+
+SEARCH_HISTORY_LIMIT = 50
 
 def initialize_session_state():
     """Initialize session state variables."""
     if 'research_results' not in st.session_state:
         st.session_state.research_results = None
     if 'search_history' not in st.session_state:
-        st.session_state.search_history = []
+        # Keep only the most recent searches
+        st.session_state.search_history = deque(maxlen=SEARCH_HISTORY_LIMIT)
 
-def setup_page_config():
-    """Configure the Streamlit page settings."""
-    # Get port from Heroku environment
-    port = int(os.environ.get("PORT", 8501))
-    
-    st.set_page_config(
-        page_title="Web Research Agent",
-        page_icon="🔍",
-        layout="wide",
-        initial_sidebar_state="expanded",
-        server_port=port,
-        server_address="0.0.0.0"
-    )
-    
-    # Add custom CSS
-    st.markdown("""
+CUSTOM_CSS = """
         <style>
         .main {max-width: 1200px;}
         .stProgress > div > div > div > div {
@@ -56,24 +46,46 @@ def setup_page_config():
         a {color: #1f77b4; text-decoration: none;}
         a:hover {color: #0056b3; text-decoration: underline;}
         </style>
-        """, unsafe_allow_html=True)
+        """
+
+def setup_page_config():
+    """Configure the Streamlit page settings."""
+    # Port and address come from the server config (see Procfile/setup.sh)
+    st.set_page_config(
+        page_title="Web Research Agent",
+        page_icon="🔍",
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+    
+    # Add custom CSS; it has to be re-sent on every rerun to stay applied
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
+DOMAIN_RE = re.compile(r"https?://(?:www\.)?([^./?#]+)")
+
+@functools.lru_cache(maxsize=512)
 def get_domain_name(url: str) -> str:
     """Extract readable domain name from URL."""
+    match = DOMAIN_RE.match(url)
+    if match:
+        return match.group(1).title()
+    # Fall back to full parsing for anything the pattern doesn't cover
     from urllib.parse import urlparse
     domain = urlparse(url).netloc
     return domain.replace("www.", "").split('.')[0].title()
 
 def display_api_status():
     """Display API connection status and diagnostics in sidebar."""
-    from utils.api_test import display_api_status
-    from utils.api_checker import get_api_status
+    from ..utils.api_test import display_api_status
+    from ..utils.api_checker import get_api_status
     
     # Display search API status
     display_api_status()
     
     # Display Gemini API status
     st.sidebar.header("🤖 Analysis API Status")
+    if st.sidebar.button("🔄 Refresh Status", use_container_width=True):
+        get_api_status.clear()
     status = get_api_status()
     
     if "Online" in status["gemini"]["status"]:
@@ -134,11 +146,11 @@ def display_sidebar():
             )
         }
     
-    # Show API status
+    # Show API status from the cached reachability checks; the paid search
+    # probes only run from the "Check API Status" button
     try:
-        from utils.search_apis import get_search_api
-        api = get_search_api(settings["search_api"])
-        status = api.check_status()
+        from ..utils.api_checker import get_api_status
+        status = get_api_status()[settings["search_api"]]
         
         if "Online" in status["status"]:
             st.sidebar.success(f"✅ {selected_api} API: Available")
@@ -173,55 +185,95 @@ def display_search_interface():
         
     return query, start_research, clear_results
 
-def display_classic_view(report):
+def display_classic_view(report, reliable_sources: int, total_sources: int):
     """Display results in classic format."""
     # Executive Summary
     st.header("📈 Executive Summary", divider="blue")
-    st.markdown(report.sections["executive_summary"]["overview"])
+    st.markdown(report.executive_summary.overview)
     
     with st.expander("Key Highlights", expanded=True):
-        for highlight in report.sections["executive_summary"]["highlights"]:
+        for highlight in report.executive_summary.highlights:
             st.markdown(f"• {highlight}")
             
-    if report.sections["executive_summary"]["conclusions"]:
+    if report.executive_summary.conclusions:
         with st.expander("Main Conclusions"):
-            for conclusion in report.sections["executive_summary"]["conclusions"]:
+            for conclusion in report.executive_summary.conclusions:
                 st.markdown(f"🎯 {conclusion}")
     
     # Detailed Findings
     st.header("🔍 Key Findings", divider="blue")
-    for theme in report.sections["detailed_findings"]["themes"]:
+    # Lowercase the evidence once rather than once per theme
+    evidence_lower = [(e, e.lower()) for e in report.detailed_findings.evidence]
+    for theme in report.detailed_findings.themes:
         with st.expander(theme):
             # Show evidence if available
-            matching_evidence = [
-                e for e in report.sections["detailed_findings"]["evidence"]
-                if e.lower().startswith(theme.lower()) or theme.lower() in e.lower()
-            ]
+            theme_lower = theme.lower()
+            matching_evidence = [e for e, el in evidence_lower if theme_lower in el]
             if matching_evidence:
                 st.markdown("**Supporting Evidence:**")
                 for evidence in matching_evidence:
                     st.markdown(f"- {evidence}")
             
             # Show opposing views if available
-            if report.sections["detailed_findings"]["opposing_views"]:
+            if report.detailed_findings.opposing_views:
                 st.markdown("**Alternative Perspectives:**")
-                for view in report.sections["detailed_findings"]["opposing_views"]:
+                for view in report.detailed_findings.opposing_views:
                     st.info(f"💭 {view}")
     
     # Source Analysis
     st.header("📚 Sources & Credibility", divider="blue")
     col1, col2 = st.columns([1, 2])
     with col1:
-        reliable_sources = len([s for s in report.sections["source_analysis"]["credibility_scores"].values() if s >= 80])
-        total_sources = len(report.sections["source_analysis"]["credibility_scores"])
         st.metric("Reliable Sources", f"{reliable_sources}/{total_sources}")
     
-    for url, score in report.sections["source_analysis"]["credibility_scores"].items():
-        with st.expander(f"Source: {get_domain_name(url)}"):
-            st.progress(score / 100)
-            st.markdown(f"**Reliability Score:** {score}%")
-            st.markdown(f"**Expertise:** {report.sections['source_analysis']['expertise_levels'].get(url, 'N/A')}")
-            st.markdown(f"🔗 [Visit Source]({url})")
+    # One table instead of an expander, progress bar and three markdown
+    # elements per source; most reliable sources first
+    scores = sorted(
+        report.source_analysis.credibility_scores.items(),
+        key=lambda item: item[1],
+        reverse=True
+    )
+    expertise = report.source_analysis.expertise_levels
+    st.dataframe(
+        pd.DataFrame({
+            "Source": [get_domain_name(url) for url, _ in scores],
+            "Reliability": [score for _, score in scores],
+            "Expertise": [expertise.get(url, "N/A") for url, _ in scores],
+            "Link": [url for url, _ in scores]
+        }),
+        column_config={
+            "Reliability": st.column_config.ProgressColumn(
+                "Reliability",
+                format="%d%%",
+                min_value=0,
+                max_value=100
+            ),
+            "Link": st.column_config.LinkColumn("Link")
+        },
+        hide_index=True,
+        use_container_width=True
+    )
+
+def _cached_for(results, key: str, build):
+    """Return build(results), reusing the value in session state until the results change."""
+    # Results stay the same object in session state across reruns
+    cached = st.session_state.get(key)
+    if cached is None or cached[0] is not results:
+        cached = (results, build(results))
+        st.session_state[key] = cached
+    return cached[1]
+
+def get_report(results):
+    """Build the report for results, reusing it until the results change."""
+    return _cached_for(results, "report", create_report_from_analysis)
+
+def get_download_data(results) -> bytes:
+    """Serialize results for download, reusing the payload until the results change."""
+    return _cached_for(
+        results,
+        "download_data",
+        lambda data: orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    )
 
 def display_raw_view(results):
     """Display raw data in a structured format."""
@@ -242,16 +294,20 @@ def display_raw_view(results):
     with st.expander("View JSON Data", expanded=True):
         st.json(results.get(sections[selected_section], {}))
     
-    # Add download option
+    # Add download option; the payload is only serialized once it's asked for
     col1, col2 = st.columns([3, 1])
     with col2:
-        download_data = json.dumps(results, indent=2)
-        st.download_button(
-            "📥 Download Full JSON",
-            download_data,
-            "research_results.json",
-            "application/json"
-        )
+        # The request is remembered per result set, like the cached payload,
+        # so new results start unserialized again
+        if st.session_state.get("download_requested") is results or st.button("📦 Prepare Download"):
+            st.session_state.download_requested = results
+            download_data = get_download_data(results)
+            st.download_button(
+                "📥 Download Full JSON",
+                download_data,
+                "research_results.json",
+                "application/json"
+            )
 
 def display_results(results):
     """Display research results in a user-friendly format."""
@@ -260,7 +316,17 @@ def display_results(results):
 
     try:
         # Create detailed report
-        report = create_report_from_analysis(results)
+        report = get_report(results)
+        
+        # Source aggregates shared by the metrics and the classic view
+        scores = report.source_analysis.credibility_scores
+        total_sources = len(scores)
+        reliable_sources = 0
+        score_sum = 0
+        for score in scores.values():
+            score_sum += score
+            if score >= 80:
+                reliable_sources += 1
         
         # Add result metadata
         st.sidebar.success("✅ Research Complete")
@@ -268,22 +334,16 @@ def display_results(results):
         # Show result stats
         col1, col2, col3 = st.columns(3)
         with col1:
-            st.metric(
-                "Sources Found",
-                len(report.sections["source_analysis"]["credibility_scores"])
-            )
+            st.metric("Sources Found", total_sources)
         with col2:
             st.metric(
                 "Key Findings",
-                len(report.sections["detailed_findings"]["themes"])
+                len(report.detailed_findings.themes)
             )
         with col3:
-            try:
-                avg_reliability = sum(
-                    report.sections["source_analysis"]["credibility_scores"].values()
-                ) / len(report.sections["source_analysis"]["credibility_scores"])
-                st.metric("Avg. Reliability", f"{avg_reliability:.0f}%")
-            except:
+            if total_sources:
+                st.metric("Avg. Reliability", f"{score_sum / total_sources:.0f}%")
+            else:
                 st.metric("Avg. Reliability", "N/A")
         
         # Display view type selector with info
@@ -303,7 +363,7 @@ def display_results(results):
         if view_type == "Enhanced":
             display_report(report)
         elif view_type == "Classic":
-            display_classic_view(report)
+            display_classic_view(report, reliable_sources, total_sources)
         else:
             display_raw_view(results)
             
@@ -326,7 +386,7 @@ def display_results(results):
 
 def main():
     """Main application function."""
-    from utils.warning_handler import setup_warning_filters
+    from ..utils.warning_handler import setup_warning_filters
     setup_warning_filters()
     
     initialize_session_state()
@@ -350,7 +410,7 @@ def main():
                 st.session_state.research_results = results
                 st.session_state.search_history.append({
                     "query": query,
-                    "timestamp": pd.Timestamp.now()
+                    "timestamp": datetime.now()
                 })
         
         if st.session_state.research_results:
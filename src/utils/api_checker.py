@@ -4,7 +4,10 @@ API status checking utilities.
 import requests
 from typing import Dict, Tuple
 import socket
-from config import SERPER_API_KEY
+from concurrent.futures import ThreadPoolExecutor
+import streamlit as st
+from ..config import SERPER_API_KEY, TAVILY_API_KEY
+from .http_client import SESSION, resolve, forget
 
 def check_serper_api() -> Tuple[bool, str]:
     """Check if Serper API is accessible and working."""
@@ -13,11 +16,11 @@ def check_serper_api() -> Tuple[bool, str]:
             "X-API-KEY": SERPER_API_KEY,
             "Content-Type": "application/json"
         }
-        response = requests.get(
+        response = SESSION.head(
             "https://google.serper.dev/search",
             headers=headers,
             timeout=5,
-            verify=False
+            allow_redirects=False
         )
         if response.status_code == 200:
             return True, "Connected"
@@ -26,35 +29,67 @@ def check_serper_api() -> Tuple[bool, str]:
     except requests.exceptions.RequestException as e:
         return False, str(e)
 
+def check_tavily_api() -> Tuple[bool, str]:
+    """Check if Tavily API is accessible via its health endpoint, which spends no credits."""
+    try:
+        response = SESSION.head(
+            "https://api.tavily.com/health",
+            headers={"Authorization": f"Bearer {TAVILY_API_KEY}"},
+            timeout=5,
+            allow_redirects=False
+        )
+        if response.status_code == 200:
+            return True, "Connected"
+        else:
+            return False, f"Error: {response.status_code}"
+    except requests.exceptions.RequestException as e:
+        return False, str(e)
+
+GEMINI_HOST = "generativelanguage.googleapis.com"
+
 def check_gemini_api() -> Tuple[bool, str]:
     """Check if Gemini API is accessible."""
     try:
         # Try DNS resolution
-        socket.gethostbyname("generativelanguage.googleapis.com")
+        ip = resolve(GEMINI_HOST)
         
-        # Try connection
-        socket.create_connection(
-            ("generativelanguage.googleapis.com", 443),
-            timeout=5
-        )
+        # Try connection; this is only a reachability ping
+        with socket.create_connection((ip, 443), timeout=2):
+            pass
         return True, "Connected"
     except socket.gaierror:
         return False, "DNS resolution failed"
     except socket.timeout:
+        # The address may have moved, so resolve it again next time
+        forget(GEMINI_HOST)
         return False, "Connection timeout"
     except Exception as e:
+        forget(GEMINI_HOST)
         return False, str(e)
 
+# The checks themselves run in worker threads without a script context,
+# so only the combined status is cached
+@st.cache_data(ttl=300, show_spinner=False)  # Cache results for 5 minutes
 def get_api_status() -> Dict:
     """Get status of all APIs."""
-    serper_ok, serper_msg = check_serper_api()
-    gemini_ok, gemini_msg = check_gemini_api()
+    # The checks are independent network probes, so run them side by side
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        serper_future = executor.submit(check_serper_api)
+        tavily_future = executor.submit(check_tavily_api)
+        gemini_future = executor.submit(check_gemini_api)
+        serper_ok, serper_msg = serper_future.result()
+        tavily_ok, tavily_msg = tavily_future.result()
+        gemini_ok, gemini_msg = gemini_future.result()
     
     return {
         "serper": {
             "status": "🟢 Online" if serper_ok else "🔴 Offline",
             "message": serper_msg
         },
+        "tavily": {
+            "status": "🟢 Online" if tavily_ok else "🔴 Offline",
+            "message": tavily_msg
+        },
         "gemini": {
             "status": "🟢 Online" if gemini_ok else "🔴 Offline",
             "message": gemini_msg
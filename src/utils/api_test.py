@@ -1,22 +1,27 @@
 """
 API testing utilities for search services.
 """
+import orjson
 import requests
 from typing import Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor
 import streamlit as st
-from config import SERPER_API_KEY, TAVILY_API_KEY, ERROR_MESSAGES
+from ..config import SERPER_API_KEY, TAVILY_API_KEY, ERROR_MESSAGES
+from .http_client import SESSION
 
 def test_serper_api() -> Dict[str, str]:
     """Test Serper API connectivity and functionality."""
+    headers = {
+        "X-API-KEY": SERPER_API_KEY,
+        "Content-Type": "application/json"
+    }
     try:
-        # Test basic connectivity
-        response = requests.get(
+        # Test basic connectivity first; the search below spends API credits
+        response = SESSION.head(
             "https://google.serper.dev/search",
-            headers={
-                "X-API-KEY": SERPER_API_KEY,
-                "Content-Type": "application/json"
-            },
-            timeout=5
+            headers=headers,
+            timeout=5,
+            allow_redirects=False
         )
         
         if response.status_code != 200:
@@ -24,21 +29,19 @@ def test_serper_api() -> Dict[str, str]:
                 "status": "🔴 Offline",
                 "message": f"API returned status code {response.status_code}"
             }
-
+        
         # Test search functionality
-        test_response = requests.post(
+        test_response = SESSION.post(
             "https://google.serper.dev/search",
-            headers={
-                "X-API-KEY": SERPER_API_KEY,
-                "Content-Type": "application/json"
-            },
+            headers=headers,
             json={
                 "q": "test query",
                 "num": 1
-            }
+            },
+            timeout=5
         )
         
-        if test_response.status_code == 200 and test_response.json().get("organic"):
+        if test_response.status_code == 200 and orjson.loads(test_response.content).get("organic"):
             return {
                 "status": "🟢 Online",
                 "message": "API is working correctly"
@@ -49,7 +52,7 @@ def test_serper_api() -> Dict[str, str]:
                 "message": "API responding but search may be restricted"
             }
             
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
         return {
             "status": "🔴 Offline",
             "message": str(e)
@@ -58,13 +61,14 @@ def test_serper_api() -> Dict[str, str]:
 def test_tavily_api() -> Dict[str, str]:
     """Test Tavily API connectivity and functionality."""
     try:
-        # Test health endpoint
-        health_response = requests.get(
+        # Test health endpoint first; the search below spends API credits
+        health_response = SESSION.head(
             "https://api.tavily.com/health",
             headers={
                 "Authorization": f"Bearer {TAVILY_API_KEY}"
             },
-            timeout=5
+            timeout=5,
+            allow_redirects=False
         )
         
         if health_response.status_code != 200:
@@ -72,19 +76,20 @@ def test_tavily_api() -> Dict[str, str]:
                 "status": "🔴 Offline",
                 "message": f"Health check failed with status {health_response.status_code}"
             }
-
+        
         # Test search functionality
-        search_response = requests.get(
+        search_response = SESSION.get(
             "https://api.tavily.com/search",
             params={
                 "api_key": TAVILY_API_KEY,
                 "query": "test query",
                 "max_results": 1,
                 "include_images": False
-            }
+            },
+            timeout=5
         )
         
-        if search_response.status_code == 200 and search_response.json().get("results"):
+        if search_response.status_code == 200 and orjson.loads(search_response.content).get("results"):
             return {
                 "status": "🟢 Online",
                 "message": "API is working correctly"
@@ -95,7 +100,7 @@ def test_tavily_api() -> Dict[str, str]:
                 "message": "API responding but search may be restricted"
             }
             
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
         return {
             "status": "🔴 Offline",
             "message": str(e)
@@ -104,10 +109,14 @@ def test_tavily_api() -> Dict[str, str]:
 @st.cache_data(ttl=300)  # Cache results for 5 minutes
 def check_search_apis() -> Dict[str, Dict[str, str]]:
     """Check status of all search APIs."""
-    return {
-        "serper": test_serper_api(),
-        "tavily": test_tavily_api()
-    }
+    # The two APIs are probed side by side
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        serper_future = executor.submit(test_serper_api)
+        tavily_future = executor.submit(test_tavily_api)
+        return {
+            "serper": serper_future.result(),
+            "tavily": tavily_future.result()
+        }
 
 def display_api_status():
     """Display API status in Streamlit sidebar."""
@@ -5,13 +5,10 @@ import requests
 import socket
 from urllib.parse import urlparse
 import ssl
-import sys
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
-# Add parent directory to Python path for imports
-sys.path.append(str(Path(__file__).parent.parent))
-
-from config import SERPER_API_KEY
+from ..config import SERPER_API_KEY
+from .http_client import SESSION
 
 class APIConnectionDiagnostics:
     def __init__(self):
@@ -21,75 +18,77 @@ class APIConnectionDiagnostics:
         
     def run_all_checks(self) -> list:
         """Run all diagnostic checks."""
-        self.check_dns()
-        self.check_api_key()
-        self.check_ssl()
-        self.check_basic_connection()
-        self.check_api_connection()
+        # The network checks are independent, so run them side by side; each
+        # check returns its own list, so results keep their usual order
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            dns_future = executor.submit(self.check_dns)
+            basic_future = executor.submit(self.check_basic_connection)
+            api_future = executor.submit(self.check_api_connection)
+            
+            for results in (
+                dns_future.result(),
+                self.check_api_key(),
+                self.check_ssl(),
+                basic_future.result(),
+                api_future.result()
+            ):
+                self.results.extend(results)
         return self.results
         
-    def check_dns(self) -> bool:
+    def check_dns(self) -> list:
         """Check if DNS resolution works."""
         try:
             domain = urlparse(self.base_url).netloc
             socket.gethostbyname(domain)
-            self.results.append(("DNS Resolution", "Success", "Domain resolves correctly"))
-            return True
+            return [("DNS Resolution", "Success", "Domain resolves correctly")]
         except socket.gaierror as e:
-            self.results.append(("DNS Resolution", "Failed", f"Cannot resolve domain: {str(e)}"))
-            return False
+            return [("DNS Resolution", "Failed", f"Cannot resolve domain: {str(e)}")]
             
-    def check_api_key(self) -> bool:
+    def check_api_key(self) -> list:
         """Validate API key format."""
         if not self.api_key:
-            self.results.append(("API Key", "Failed", "API key is missing"))
-            return False
+            return [("API Key", "Failed", "API key is missing")]
         if len(self.api_key) < 10:
-            self.results.append(("API Key", "Failed", "API key appears too short"))
-            return False
+            return [("API Key", "Failed", "API key appears too short")]
             
-        self.results.append(("API Key", "Success", "API key format appears valid"))
-        return True
+        return [("API Key", "Success", "API key format appears valid")]
         
-    def check_ssl(self) -> bool:
+    def check_ssl(self) -> list:
         """Check SSL connection."""
         try:
             # Try creating SSL context
             context = ssl.create_default_context()
-            self.results.append(("SSL Configuration", "Success", "SSL context created successfully"))
-            return True
+            return [("SSL Configuration", "Success", "SSL context created successfully")]
         except ssl.SSLError as e:
-            self.results.append(("SSL Configuration", "Failed", f"SSL Error: {str(e)}"))
-            return False
+            return [("SSL Configuration", "Failed", f"SSL Error: {str(e)}")]
             
-    def check_basic_connection(self) -> bool:
+    def check_basic_connection(self) -> list:
         """Test basic HTTPS connection."""
         try:
-            response = requests.get(
+            response = SESSION.get(
                 self.base_url,
                 timeout=5,
                 verify=True
             )
-            self.results.append(("Basic Connection", "Success", f"Server responded with status {response.status_code}"))
-            return True
+            return [("Basic Connection", "Success", f"Server responded with status {response.status_code}")]
         except requests.exceptions.SSLError:
-            self.results.append(("Basic Connection", "Warning", "SSL verification failed, trying without verification"))
+            results = [("Basic Connection", "Warning", "SSL verification failed, trying without verification")]
             try:
+                # One-off request: an unverified connection must never go
+                # back into SESSION's pool, which carries the API key
                 response = requests.get(
                     self.base_url,
                     timeout=5,
                     verify=False
                 )
-                self.results.append(("Basic Connection (No SSL)", "Success", "Connection works without SSL verification"))
-                return True
+                results.append(("Basic Connection (No SSL)", "Success", "Connection works without SSL verification"))
             except Exception as e:
-                self.results.append(("Basic Connection", "Failed", f"Connection failed even without SSL: {str(e)}"))
-                return False
+                results.append(("Basic Connection", "Failed", f"Connection failed even without SSL: {str(e)}"))
+            return results
         except Exception as e:
-            self.results.append(("Basic Connection", "Failed", f"Connection error: {str(e)}"))
-            return False
+            return [("Basic Connection", "Failed", f"Connection error: {str(e)}")]
             
-    def check_api_connection(self) -> bool:
+    def check_api_connection(self) -> list:
         """Test actual API endpoint."""
         headers = {
             "X-API-KEY": self.api_key,
@@ -102,7 +101,7 @@ class APIConnectionDiagnostics:
         }
         
         try:
-            response = requests.post(
+            response = SESSION.post(
                 f"{self.base_url}/search",
                 headers=headers,
                 json=payload,
@@ -111,20 +110,16 @@ class APIConnectionDiagnostics:
             )
             
             if response.status_code == 200:
-                self.results.append(("API Connection", "Success", "API responded successfully"))
-                return True
+                return [("API Connection", "Success", "API responded successfully")]
             elif response.status_code == 401:
-                self.results.append(("API Connection", "Failed", "Invalid API key"))
+                return [("API Connection", "Failed", "Invalid API key")]
             elif response.status_code == 429:
-                self.results.append(("API Connection", "Failed", "Rate limit exceeded"))
+                return [("API Connection", "Failed", "Rate limit exceeded")]
             else:
-                self.results.append(("API Connection", "Failed", f"API returned status code {response.status_code}"))
-            
-            return False
+                return [("API Connection", "Failed", f"API returned status code {response.status_code}")]
             
         except Exception as e:
-            self.results.append(("API Connection", "Failed", f"API request failed: {str(e)}"))
-            return False
+            return [("API Connection", "Failed", f"API request failed: {str(e)}")]
             
 def run_diagnostics() -> list:
     """Run all API diagnostics and return results."""
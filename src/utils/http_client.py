@@ -0,0 +1,42 @@
+"""
+Shared HTTP session and DNS cache for the search API client and probes.
+"""
+import socket
+import time
+from typing import Dict, Tuple
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# One pooled session keeps connections (and their TLS handshakes) alive
+# between requests instead of opening a new socket for every request.
+# Headers are passed per request, so no API key leaks between services.
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=1, backoff_factor=0.2)
+    )
+)
+
+# Resolved addresses are reused for this long (seconds)
+DNS_TTL = 300
+
+# host -> (ip, expires_at)
+_dns_cache: Dict[str, Tuple[str, float]] = {}
+
+def resolve(host: str, refresh: bool = False) -> str:
+    """Resolve a host name to an IP address, reusing answers for DNS_TTL seconds."""
+    now = time.monotonic()
+    cached = _dns_cache.get(host)
+    if cached and cached[1] > now and not refresh:
+        return cached[0]
+    ip = socket.gethostbyname(host)
+    _dns_cache[host] = (ip, now + DNS_TTL)
+    return ip
+
+def forget(host: str):
+    """Drop a cached address, e.g. after connecting to it failed."""
+    _dns_cache.pop(host, None)
@@ -1,26 +1,28 @@
 """
 Network diagnostics and connection testing utilities.
 """
+import asyncio
 import socket
-import subprocess
-import platform
-import requests
+import time
 import ssl
-from urllib3.util.retry import Retry
 import json
-from pathlib import Path
-import sys
+import httpx
 import warnings
 from urllib3.exceptions import InsecureRequestWarning
 from .warning_handler import suppress_warnings, handler
+from ..config import SERPER_API_KEY
+from .http_client import resolve, forget
 
 # Define warning categories
 RESOURCE_WARNINGS = [Warning]  # Catch all resource-related warnings
 
-# Add parent directory to Python path for imports
-sys.path.append(str(Path(__file__).parent.parent))
+# Built once so repeated SSL checks don't reload the CA bundle
+SSL_CTX = ssl.create_default_context()
 
-from config import SERPER_API_KEY
+# httpx sets ALPN on the context it is given, so the API probes get their
+# own rather than mutating SSL_CTX while check_connection uses it
+API_SSL_CTX = ssl.create_default_context()
+API_SSL_CTX.set_alpn_protocols(["h2", "http/1.1"])
 
 class NetworkDiagnostics:
     def __init__(self):
@@ -30,126 +32,142 @@ class NetworkDiagnostics:
         
     def run_all_checks(self) -> list:
         """Run all network diagnostic checks."""
-        self.check_dns()
-        self.check_ping()
-        self.check_ssl()
-        self.test_api_variations()
+        return asyncio.run(self.run_all_checks_async())
+        
+    async def run_all_checks_async(self) -> list:
+        """Run all network diagnostic checks concurrently."""
+        checks = (self.check_dns, self.check_connection)
+        
+        # Warning filters are process-wide, so suppress once around all checks
+        # rather than inside each worker thread
+        with suppress_warnings(RESOURCE_WARNINGS + [InsecureRequestWarning]):
+            check_results = await asyncio.gather(
+                *(asyncio.to_thread(check) for check in checks),
+                self.test_api_variations()
+            )
+        
+        # Each check returns its own list, so results keep their usual order
+        for results in check_results:
+            self.results.extend(results)
         return self.results
         
-    def check_dns(self):
+    def check_dns(self) -> list:
         """Check DNS resolution."""
         try:
-            ip = socket.gethostbyname(self.target_host)
-            self.results.append(("DNS Resolution", "Success", f"Resolved to {ip}"))
+            # Always look the name up afresh; this also refreshes the cache
+            ip = resolve(self.target_host, refresh=True)
+            return [("DNS Resolution", "Success", f"Resolved to {ip}")]
         except socket.gaierror as e:
-            self.results.append(("DNS Resolution", "Failed", f"DNS lookup failed: {str(e)}"))
+            return [("DNS Resolution", "Failed", f"DNS lookup failed: {str(e)}")]
             
-    def check_ping(self):
-        """Check if host responds to ping."""
-        param = "-n" if platform.system().lower() == "windows" else "-c"
-        command = ["ping", param, "1", self.target_host]
+    def check_connection(self) -> list:
+        """Check TCP reachability and SSL over a single connection."""
+        results = []
+        try:
+            # A timed TCP connect stands in for ping: it needs no external
+            # binary and also proves the HTTPS port is open
+            start = time.perf_counter()
+            sock = socket.create_connection((resolve(self.target_host), 443), timeout=3)
+            rtt = (time.perf_counter() - start) * 1000
+        except Exception as e:
+            # The address may have moved, so resolve it again next time.
+            # SSL is not reported: without a connection it was never tried.
+            forget(self.target_host)
+            results.append(("Reachability", "Failed", f"TCP connect failed: {str(e)}"))
+            return results
+        results.append(("Reachability", "Success", f"{rtt:.1f}ms TCP connect"))
         
-        with suppress_warnings(RESOURCE_WARNINGS):
-            try:
-                output = subprocess.check_output(command, stderr=subprocess.STDOUT, universal_newlines=True)
-                if "TTL=" in output or "ttl=" in output:
-                    self.results.append(("Ping Test", "Success", "Host is responding to ping"))
-                else:
-                    self.results.append(("Ping Test", "Warning", "Host not responding to ping"))
-            except subprocess.CalledProcessError:
-                self.results.append(("Ping Test", "Failed", "Ping failed"))
-            
-    def check_ssl(self):
-        """Test SSL connection with different configurations."""
-        context = None
+        # Try default SSL context on the same connection
         try:
-            # Try default SSL context
-            context = ssl.create_default_context()
-            with socket.create_connection((self.target_host, 443)) as sock:
-                try:
-                    with context.wrap_socket(sock, server_hostname=self.target_host) as ssock:
-                        cipher = ssock.cipher()
-                        self.results.append(("SSL Connection", "Success", f"Connected using {cipher[0]}"))
-                except ssl.SSLError as e:
-                    self.results.append(("SSL Connection", "Warning", f"Default SSL failed: {str(e)}"))
-                    raise
+            with sock, SSL_CTX.wrap_socket(sock, server_hostname=self.target_host) as ssock:
+                cipher = ssock.cipher()
+                results.append(("SSL Connection", "Success", f"Connected using {cipher[0]}"))
+                return results
         except Exception as e:
-            self.results.append(("SSL Connection", "Warning", f"Default SSL failed: {str(e)}"))
-            
-            # Try without verification
-            try:
-                context = ssl._create_unverified_context()
-                with socket.create_connection((self.target_host, 443)) as sock:
-                    with context.wrap_socket(sock) as ssock:
-                        self.results.append(("SSL Connection", "Warning", "Connected without verification"))
-            except Exception as e:
-                self.results.append(("SSL Connection", "Failed", f"All SSL attempts failed: {str(e)}"))
+            results.append(("SSL Connection", "Warning", f"Default SSL failed: {str(e)}"))
+        
+        # Try without verification; the failed handshake closed the first socket
+        try:
+            context = ssl._create_unverified_context()
+            with socket.create_connection((resolve(self.target_host), 443), timeout=3) as sock:
+                with context.wrap_socket(sock) as ssock:
+                    results.append(("SSL Connection", "Warning", "Connected without verification"))
+        except Exception as e:
+            results.append(("SSL Connection", "Failed", f"All SSL attempts failed: {str(e)}"))
+        return results
                 
-    def test_api_variations(self):
+    async def test_api_variations(self) -> list:
         """Test API connection with different configurations."""
-        headers_variations = [
-            {
+        results = []
+        # Header sets are built on demand, so the fallbacks cost nothing
+        # when the first variation works
+        header_makers = (
+            lambda: {
                 "X-API-KEY": self.api_key,
                 "Content-Type": "application/json"
             },
-            {
+            lambda: {
                 "X-API-KEY": self.api_key,
                 "Content-Type": "application/json",
                 "Accept": "application/json"
             },
-            {
+            lambda: {
                 "Authorization": f"Bearer {self.api_key}",
                 "Content-Type": "application/json"
             }
-        ]
+        )
         
         test_payload = {
             "q": "test query",
             "num": 1
         }
         
-        # Configure session with retries
-        session = requests.Session()
-        retries = Retry(
-            total=3,
-            backoff_factor=0.5,
-            status_forcelist=[429, 500, 502, 503, 504]
-        )
-        session.mount("https://", requests.adapters.HTTPAdapter(max_retries=retries))
-        
-        # Disable SSL verification warnings
-        with suppress_warnings([InsecureRequestWarning]):
-        
-            # Test each header variation
-            for i, headers in enumerate(headers_variations, 1):
-                try:
-                    response = session.post(
-                        f"https://{self.target_host}/search",
-                        headers=headers,
-                        json=test_payload,
-                        timeout=5,
-                        verify=False  # Initially try without verification
-                    )
-                    
-                    if response.status_code == 200:
-                        self.results.append((
-                            f"API Test {i}",
-                            "Success",
-                            f"Connected successfully with header variation {i}"
-                        ))
-                        return  # Found working configuration
-                    else:
-                        self.results.append((
+        # Over HTTP/2 every variation shares one connection
+        url = f"https://{self.target_host}/search"
+        transport = httpx.AsyncHTTPTransport(verify=API_SSL_CTX, http2=True, retries=1)
+        async with httpx.AsyncClient(transport=transport, timeout=5) as client:
+            def send(make_headers):
+                return asyncio.create_task(client.post(url, headers=make_headers(), json=test_payload))
+            
+            # Every variation is a billed search, so the fallbacks are only
+            # sent once the first has actually failed
+            tasks = [send(header_makers[0])]
+            try:
+                first = tasks[0]
+                await asyncio.wait(tasks)
+                if first.exception() is not None or first.result().status_code != 200:
+                    tasks.extend(send(make_headers) for make_headers in header_makers[1:])
+                
+                # Report the variations in order, stopping at the first that works
+                for i, task in enumerate(tasks, 1):
+                    try:
+                        response = await task
+                        
+                        if response.status_code == 200:
+                            results.append((
+                                f"API Test {i}",
+                                "Success",
+                                f"Connected successfully with header variation {i}"
+                            ))
+                            break  # Found working configuration
+                        else:
+                            results.append((
+                                f"API Test {i}",
+                                "Warning",
+                                f"Status code: {response.status_code}, Response: {response.text[:100]}"
+                            ))
+                    except Exception as e:
+                        results.append((
                             f"API Test {i}",
-                            "Warning",
-                            f"Status code: {response.status_code}, Response: {response.text[:100]}"
+                            "Failed",
+                            f"Connection failed: {str(e)}"
                         ))
-                except Exception as e:
-                    self.results.append((
-                        f"API Test {i}",
-                        "Failed",
-                        f"Connection failed: {str(e)}"
-                    ))
+            finally:
+                # Cancel whatever is still in flight and reap the tasks
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+        return results
 
 def analyze_connection_issues(results: list) -> dict:
     """Analyze diagnostic results and provide recommendations."""
@@ -159,10 +177,19 @@ def analyze_connection_issues(results: list) -> dict:
         "recommendations": []
     }
     
-    # Check for critical failures
-    dns_failed = any(r[0] == "DNS Resolution" and r[1] == "Failed" for r in results)
-    ssl_failed = any(r[0] == "SSL Connection" and r[1] == "Failed" for r in results)
-    api_failed = all(r[0].startswith("API Test") and r[1] != "Success" for r in results)
+    # Check for critical failures in a single pass
+    dns_failed = unreachable = ssl_failed = api_tested = api_succeeded = False
+    for name, status, _ in results:
+        if name == "DNS Resolution":
+            dns_failed = dns_failed or status == "Failed"
+        elif name == "Reachability":
+            unreachable = unreachable or status == "Failed"
+        elif name == "SSL Connection":
+            ssl_failed = ssl_failed or status == "Failed"
+        elif name.startswith("API Test"):
+            api_tested = True
+            api_succeeded = api_succeeded or status == "Success"
+    api_failed = api_tested and not api_succeeded
     
     if dns_failed:
         analysis["issues"].append("DNS resolution failure")
@@ -172,6 +199,14 @@ def analyze_connection_issues(results: list) -> dict:
             "Check your network connectivity"
         ])
         
+    # Without DNS the connect can't succeed either, so only report it separately
+    if unreachable and not dns_failed:
+        analysis["issues"].append("Server unreachable")
+        analysis["recommendations"].extend([
+            "Check your network connectivity",
+            "Check if a firewall or proxy blocks outbound HTTPS (port 443)"
+        ])
+        
     if ssl_failed:
         analysis["issues"].append("SSL certificate verification failure")
         analysis["recommendations"].extend([
@@ -0,0 +1,38 @@
+"""
+Process-wide rate limiting for outbound API calls.
+"""
+import asyncio
+import threading
+import time
+
+class RateLimiter:
+    """Token bucket shared by every thread and event loop in the process.
+
+    Streamlit runs each research request in its own asyncio.run, so a
+    loop-bound limiter would start every run with a full bucket.
+    """
+    def __init__(self, max_rate: int, time_period: float = 60):
+        self.capacity = max_rate
+        self.rate = max_rate / time_period
+        self._tokens = float(max_rate)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token and return how long to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            # A negative balance queues the caller behind earlier reservations
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    async def __aenter__(self):
+        delay = self._reserve()
+        if delay:
+            await asyncio.sleep(delay)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return None
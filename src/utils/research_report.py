@@ -1,97 +1,105 @@
 """
 Enhanced research report generation and formatting.
 """
+import copy
+import html
+from dataclasses import asdict, dataclass, field
 from typing import Dict, List, Any
 from datetime import datetime
 import streamlit as st
 
+@dataclass(slots=True)
+class ExecutiveSummary:
+    overview: str = ""
+    highlights: List[str] = field(default_factory=list)
+    conclusions: List[str] = field(default_factory=list)
+
+@dataclass(slots=True)
+class DetailedFindings:
+    themes: List[str] = field(default_factory=list)
+    evidence: List[str] = field(default_factory=list)
+    opposing_views: List[str] = field(default_factory=list)
+    metrics: Dict[str, Any] = field(default_factory=dict)
+
+@dataclass(slots=True)
+class SourceAnalysis:
+    """Per-source details, each keyed by source URL."""
+    credibility_scores: Dict[str, int] = field(default_factory=dict)
+    publication_dates: Dict[str, str] = field(default_factory=dict)
+    expertise_levels: Dict[str, str] = field(default_factory=dict)
+    citation_counts: Dict[str, int] = field(default_factory=dict)
+
+@dataclass(slots=True)
+class Context:
+    historical: str = ""
+    current: str = ""
+    future: str = ""
+    industry_impact: List[str] = field(default_factory=list)
+
+@dataclass(slots=True)
+class Recommendations:
+    actions: List[str] = field(default_factory=list)
+    further_research: List[str] = field(default_factory=list)
+    risks: List[str] = field(default_factory=list)
+    strategy: List[str] = field(default_factory=list)
+
+@dataclass(slots=True)
 class ResearchReport:
-    def __init__(self):
-        self.sections = {
-            "executive_summary": {
-                "overview": "",
-                "highlights": [],
-                "conclusions": []
-            },
-            "detailed_findings": {
-                "themes": [],
-                "evidence": [],
-                "opposing_views": [],
-                "metrics": {}
-            },
-            "source_analysis": {
-                "credibility_scores": {},
-                "publication_dates": {},
-                "expertise_levels": {},
-                "citation_counts": {}
-            },
-            "context": {
-                "historical": "",
-                "current": "",
-                "future": "",
-                "industry_impact": []
-            },
-            "recommendations": {
-                "actions": [],
-                "further_research": [],
-                "risks": [],
-                "strategy": []
-            }
-        }
+    executive_summary: ExecutiveSummary = field(default_factory=ExecutiveSummary)
+    detailed_findings: DetailedFindings = field(default_factory=DetailedFindings)
+    source_analysis: SourceAnalysis = field(default_factory=SourceAnalysis)
+    context: Context = field(default_factory=Context)
+    recommendations: Recommendations = field(default_factory=Recommendations)
 
     def set_executive_summary(self, summary: str, highlights: List[str], conclusions: List[str]):
         """Set executive summary section."""
-        self.sections["executive_summary"].update({
-            "overview": summary,
-            "highlights": highlights,
-            "conclusions": conclusions
-        })
+        self.executive_summary = ExecutiveSummary(summary, highlights, conclusions)
 
     def add_detailed_finding(self, theme: str, evidence: List[str], opposing_view: str = None):
         """Add a detailed finding with supporting evidence."""
-        self.sections["detailed_findings"]["themes"].append(theme)
-        self.sections["detailed_findings"]["evidence"].extend(evidence)
+        self.detailed_findings.themes.append(theme)
+        self.detailed_findings.evidence.extend(evidence)
         if opposing_view:
-            self.sections["detailed_findings"]["opposing_views"].append(opposing_view)
+            self.detailed_findings.opposing_views.append(opposing_view)
 
     def add_source(self, url: str, credibility: int, expertise: str, citations: int = 0):
         """Add source analysis information."""
-        self.sections["source_analysis"]["credibility_scores"][url] = credibility
-        self.sections["source_analysis"]["expertise_levels"][url] = expertise
-        self.sections["source_analysis"]["citation_counts"][url] = citations
-        self.sections["source_analysis"]["publication_dates"][url] = datetime.now().strftime("%Y-%m-%d")
+        sources = self.source_analysis
+        sources.credibility_scores[url] = credibility
+        sources.expertise_levels[url] = expertise
+        sources.citation_counts[url] = citations
+        sources.publication_dates[url] = datetime.now().strftime("%Y-%m-%d")
 
     def set_context(self, historical: str, current: str, future: str, impacts: List[str]):
         """Set contextual analysis."""
-        self.sections["context"].update({
-            "historical": historical,
-            "current": current,
-            "future": future,
-            "industry_impact": impacts
-        })
+        self.context = Context(historical, current, future, impacts)
 
     def add_recommendations(self, actions: List[str], research: List[str], risks: List[str], strategy: List[str]):
         """Add recommendations section."""
-        self.sections["recommendations"].update({
-            "actions": actions,
-            "further_research": research,
-            "risks": risks,
-            "strategy": strategy
-        })
+        self.recommendations = Recommendations(actions, research, risks, strategy)
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Return the report as the nested section dicts it used to be stored as."""
+        return asdict(self)
+
+def render_items(render, icon: str, items: List[str]):
+    """Render a list of items as one Streamlit element instead of one per item."""
+    if items:
+        render("\n\n".join(f"{icon} {item}" for item in items))
 
 def display_report(report: ResearchReport):
     """Display the research report in a structured format."""
     # Executive Summary Section
     st.header("📊 Executive Summary", divider="blue")
     with st.expander("Overview", expanded=True):
-        st.write(report.sections["executive_summary"]["overview"])
+        st.write(report.executive_summary.overview)
         
         st.subheader("Key Highlights")
-        for highlight in report.sections["executive_summary"]["highlights"]:
+        for highlight in report.executive_summary.highlights:
             st.markdown(f"• {highlight}")
             
         st.subheader("Main Conclusions")
-        for conclusion in report.sections["executive_summary"]["conclusions"]:
+        for conclusion in report.executive_summary.conclusions:
             st.markdown(f"🎯 {conclusion}")
     
     # Detailed Findings Section
@@ -101,115 +109,119 @@ def display_report(report: ResearchReport):
     ])
     
     with themes_tab:
-        for theme in report.sections["detailed_findings"]["themes"]:
-            with st.container():
-                st.markdown(f"""
-                    <div style='background-color: #f8f9fa; padding: 1rem; border-radius: 0.5rem; margin: 0.5rem 0;'>
-                        <h4>{theme}</h4>
-                    </div>
-                """, unsafe_allow_html=True)
+        # Themes are raw model output, so escape them before embedding in HTML
+        st.markdown("".join(
+            "<div style='background-color: #f8f9fa; padding: 1rem; border-radius: 0.5rem; margin: 0.5rem 0;'>"
+            f"<h4>{html.escape(theme)}</h4>"
+            "</div>"
+            for theme in report.detailed_findings.themes
+        ), unsafe_allow_html=True)
                 
     with evidence_tab:
-        for evidence in report.sections["detailed_findings"]["evidence"]:
-            st.markdown(f"📝 {evidence}")
+        render_items(st.markdown, "📝", report.detailed_findings.evidence)
             
     with opposing_tab:
-        for view in report.sections["detailed_findings"]["opposing_views"]:
-            st.info(f"💭 {view}")
+        render_items(st.info, "💭", report.detailed_findings.opposing_views)
     
     # Source Analysis Section
     st.header("📚 Source Credibility Analysis", divider="blue")
-    sources = report.sections["source_analysis"]
+    sources = report.source_analysis
+    expertise_levels = sources.expertise_levels
+    citation_counts = sources.citation_counts
     
-    for url in sources["credibility_scores"].keys():
+    for url, credibility in sources.credibility_scores.items():
         with st.expander(f"Source: {url}"):
             cols = st.columns([1, 2, 1])
             with cols[0]:
-                st.metric("Credibility Score", f"{sources['credibility_scores'][url]}%")
+                st.metric("Credibility Score", f"{credibility}%")
             with cols[1]:
-                st.write(f"Expertise: {sources['expertise_levels'][url]}")
+                st.write(f"Expertise: {expertise_levels[url]}")
             with cols[2]:
-                st.write(f"Citations: {sources['citation_counts'][url]}")
+                st.write(f"Citations: {citation_counts[url]}")
                 
     # Context Section
     st.header("🌐 Context & Implications", divider="blue")
-    context = report.sections["context"]
+    context = report.context
     
     with st.expander("Historical Context"):
-        st.write(context["historical"])
+        st.write(context.historical)
     with st.expander("Current Landscape"):
-        st.write(context["current"])
+        st.write(context.current)
     with st.expander("Future Outlook"):
-        st.write(context["future"])
+        st.write(context.future)
         
     st.subheader("Industry Impact")
-    for impact in context["industry_impact"]:
+    for impact in context.industry_impact:
         st.warning(impact)
     
     # Recommendations Section
     st.header("💡 Recommendations & Next Steps", divider="blue")
-    recs = report.sections["recommendations"]
+    recs = report.recommendations
     
     col1, col2 = st.columns(2)
     with col1:
         st.subheader("Actionable Steps")
-        for action in recs["actions"]:
-            st.success(f"✅ {action}")
+        render_items(st.success, "✅", recs.actions)
             
         st.subheader("Further Research")
-        for research in recs["further_research"]:
-            st.info(f"🔍 {research}")
+        render_items(st.info, "🔍", recs.further_research)
             
     with col2:
         st.subheader("Potential Risks")
-        for risk in recs["risks"]:
-            st.error(f"⚠️ {risk}")
+        render_items(st.error, "⚠️", recs.risks)
             
         st.subheader("Strategic Considerations")
-        for strategy in recs["strategy"]:
-            st.warning(f"🎯 {strategy}")
+        render_items(st.warning, "🎯", recs.strategy)
+
+# Sections every analysis is normalized to, with their default values
+REQUIRED_FIELDS = {
+    "executive_summary": {
+        "overview": "",
+        "highlights": [],
+        "conclusions": []
+    },
+    "detailed_findings": {
+        "themes": [],
+        "evidence": [],
+        "opposing_views": []
+    },
+    "source_analysis": [],
+    "context": {
+        "historical": "",
+        "current": "",
+        "future": "",
+        "impacts": []
+    },
+    "recommendations": {
+        "actions": [],
+        "research": [],
+        "risks": [],
+        "strategy": []
+    }
+}
+
+# (section, [(field, default), ...]) pairs, or None for list sections
+SECTION_FIELDS = [
+    (section, list(defaults.items()) if isinstance(defaults, dict) else None)
+    for section, defaults in REQUIRED_FIELDS.items()
+]
 
 def validate_response(response: Dict) -> Dict:
     """Validate and normalize response format."""
-    required_fields = {
-        "executive_summary": {
-            "overview": "",
-            "highlights": [],
-            "conclusions": []
-        },
-        "detailed_findings": {
-            "themes": [],
-            "evidence": [],
-            "opposing_views": []
-        },
-        "source_analysis": [],
-        "context": {
-            "historical": "",
-            "current": "",
-            "future": "",
-            "impacts": []
-        },
-        "recommendations": {
-            "actions": [],
-            "research": [],
-            "risks": [],
-            "strategy": []
-        }
-    }
-    
-    # Ensure all required fields exist
+    # Ensure all required fields exist; defaults are copied so callers
+    # never share the module-level lists
     validated = {}
-    for section, defaults in required_fields.items():
-        if section not in response:
-            validated[section] = defaults
+    for section, fields in SECTION_FIELDS:
+        values = response.get(section)
+        if values is None:
+            validated[section] = copy.deepcopy(REQUIRED_FIELDS[section])
+        elif fields is None:
+            validated[section] = values
         else:
-            if isinstance(defaults, dict):
-                validated[section] = {
-                    field: response[section].get(field, default)
-                    for field, default in defaults.items()
-                }
-            else:
-                validated[section] = response[section]
+            validated[section] = {
+                field: values[field] if field in values else copy.copy(default)
+                for field, default in fields
+            }
     
     return validated
 
@@ -264,12 +276,16 @@ def create_report_from_analysis(analysis: Dict[str, Any]) -> ResearchReport:
         conclusions=validated["executive_summary"]["conclusions"]
     )
     
-    # Add detailed findings
-    for theme in validated["detailed_findings"]["themes"]:
+    # Add detailed findings; the evidence and opposing view are shared by
+    # all themes, so attach them once rather than copying them per theme
+    findings = validated["detailed_findings"]
+    evidence = [e for e in findings["evidence"] if e]
+    opposing_view = findings["opposing_views"][0] if findings["opposing_views"] else None
+    for i, theme in enumerate(findings["themes"]):
         report.add_detailed_finding(
             theme=theme,
-            evidence=[e for e in validated["detailed_findings"]["evidence"] if e],
-            opposing_view=validated["detailed_findings"]["opposing_views"][0] if validated["detailed_findings"]["opposing_views"] else None
+            evidence=evidence if i == 0 else [],
+            opposing_view=opposing_view if i == 0 else None
         )
     
     # Add source analysis
@@ -4,7 +4,13 @@ Search API implementations and handlers.
 import requests
 import functools
 from typing import Dict, List
-from config import SEARCH_APIS, ERROR_MESSAGES, REQUEST_TIMEOUT
+from ..config import SEARCH_APIS, ERROR_MESSAGES
+
+# HTTP status codes with a dedicated user-facing message
+HTTP_ERROR_MESSAGES = {
+    401: ERROR_MESSAGES["api_unavailable"],
+    429: ERROR_MESSAGES["rate_limit"]
+}
 
 def handle_api_errors(func):
     """Decorator to handle API errors consistently."""
@@ -12,72 +18,16 @@ def handle_api_errors(func):
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
+        except requests.exceptions.Timeout:
+            raise Exception(ERROR_MESSAGES["network_error"])
+        except requests.exceptions.HTTPError as e:
+            status = e.response.status_code if e.response is not None else None
+            message = HTTP_ERROR_MESSAGES.get(status)
+            raise Exception(message or f"Search failed: {str(e)}")
         except Exception as e:
-            if "401" in str(e):
-                raise Exception(ERROR_MESSAGES["api_unavailable"])
-            elif "429" in str(e):
-                raise Exception(ERROR_MESSAGES["rate_limit"])
-            elif "timeout" in str(e):
-                raise Exception(ERROR_MESSAGES["network_error"])
-            else:
-                raise Exception(f"Search failed: {str(e)}")
+            raise Exception(f"Search failed: {str(e)}")
     return wrapper
 
-class SerperAPI:
-    """Serper API implementation."""
-    def __init__(self, api_key: str):
-        self.session = requests.Session()
-        self.session.headers.update({
-            "X-API-KEY": api_key,
-            "Content-Type": "application/json"
-        })
-        self.endpoint = SEARCH_APIS["serper"]["endpoint"]
-    
-    @handle_api_errors
-    def search(self, query: str, settings: Dict) -> List[Dict]:
-        """Perform search using Serper API."""
-        params = {
-            "q": query,
-            "num": settings.get("max_results", 10)
-        }
-        
-        time_range = settings.get("time_range", "All time")
-        if time_range != "All time":
-            params["timeRange"] = time_range.lower()
-        
-        response = self.session.post(
-            self.endpoint,
-            json=params,
-            timeout=REQUEST_TIMEOUT,
-            verify=False
-        )
-        response.raise_for_status()
-        return response.json().get("organic", [])
-    
-    def check_status(self) -> Dict[str, str]:
-        """Check API health."""
-        try:
-            response = self.session.get(
-                self.endpoint,
-                timeout=5,
-                verify=False
-            )
-            if response.status_code == 200:
-                return {
-                    "status": "🟢 Online",
-                    "message": "API is working"
-                }
-            else:
-                return {
-                    "status": "🔴 Offline",
-                    "message": f"API returned status {response.status_code}"
-                }
-        except Exception as e:
-            return {
-                "status": "🔴 Offline",
-                "message": str(e)
-            }
-
 class TavilyAPI:
     """Tavily API implementation using official SDK."""
     def __init__(self, api_key: str):
@@ -134,9 +84,8 @@ class TavilyAPI:
 
 def get_search_api(api_name: str):
     """Get configured search API instance."""
-    if api_name == "serper":
-        return SerperAPI(SEARCH_APIS["serper"]["key"])
-    elif api_name == "tavily":
+    # Serper is called directly by ResearchManager through its async client
+    if api_name == "tavily":
         return TavilyAPI(SEARCH_APIS["tavily"]["key"])
     else:
         raise ValueError(f"Unknown API: {api_name}")
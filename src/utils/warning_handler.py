@@ -2,31 +2,31 @@
 Utility for handling and managing warnings.
 """
 import warnings
+from collections import deque
 from urllib3.exceptions import InsecureRequestWarning
 import streamlit as st
 from contextlib import contextmanager
 from typing import List, Dict, Optional, Type
 
+# Most recent warnings kept by WarningHandler
+MAX_WARNINGS = 500
+
 class WarningHandler:
     def __init__(self):
-        self.warnings = []
+        # Bounded so a noisy library can't grow this for the whole session
+        self.warnings = deque(maxlen=MAX_WARNINGS)
         self.enabled = True
         
     def __call__(self, message, category, filename, lineno, file=None, line=None):
         """Handle warning as a callable."""
-        if self.enabled:
-            warning_info = {
-                "message": str(message),
-                "category": category.__name__,
-                "file": filename,
-                "line": lineno,
-                "context": line
-            }
-            self.warnings.append(warning_info)
+        if not self.enabled:
+            return
+        # Store the raw fields; dicts are only built when warnings are read
+        self.warnings.append((message, category.__name__, filename, lineno, line))
             
     def clear(self):
         """Clear stored warnings."""
-        self.warnings = []
+        self.warnings.clear()
         
     def disable(self):
         """Disable warning collection."""
@@ -38,7 +38,16 @@ class WarningHandler:
         
     def get_warnings(self) -> List[Dict]:
         """Get collected warnings."""
-        return self.warnings
+        return [
+            {
+                "message": str(message),
+                "category": category,
+                "file": filename,
+                "line": lineno,
+                "context": line
+            }
+            for message, category, filename, lineno, line in self.warnings
+        ]
 
 @contextmanager
 def suppress_warnings(warning_types: Optional[List[Type[Warning]]] = None):
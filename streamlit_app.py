@@ -0,0 +1,6 @@
+"""
+Streamlit entry point for the Web Research Agent.
+"""
+from src.frontend.app import main
+
+main()